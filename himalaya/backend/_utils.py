@@ -15,6 +15,9 @@ MATCHING_CPU_BACKEND = {
     "torch_mps": "torch",
 }
 
+# Backend modules already imported, to make get_backend cheap in hot paths.
+_BACKEND_MODULES = {}
+
 
 def set_backend(backend, on_error="raise"):
     """Set the backend using a global variable, and return the backend module.
@@ -67,8 +70,12 @@ def get_backend():
     module : python module
         Module of the backend.
     """
-    module = importlib.import_module(__package__ + "." + CURRENT_BACKEND)
-    return module
+    try:
+        return _BACKEND_MODULES[CURRENT_BACKEND]
+    except KeyError:
+        module = importlib.import_module(__package__ + "." + CURRENT_BACKEND)
+        _BACKEND_MODULES[CURRENT_BACKEND] = module
+        return module
 
 
 def _dtype_to_str(dtype):
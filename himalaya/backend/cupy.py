@@ -210,3 +210,15 @@ def svd(X, full_matrices=True):
         return map(cupy.stack, zip(*UsV_list))
     else:
         raise NotImplementedError()
+
+
+def cholesky(A):
+    """Lower Cholesky factor L of a symmetric positive definite A = L @ L.T"""
+    return cupy.linalg.cholesky(A)
+
+
+def cho_solve(L, B):
+    """Solve A @ X = B, given the lower Cholesky factor L of A."""
+    from cupyx.scipy.linalg import solve_triangular
+    return solve_triangular(L.T, solve_triangular(L, B, lower=True),
+                            lower=False)
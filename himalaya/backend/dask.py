@@ -212,3 +212,15 @@ def svd(X, full_matrices=True):
         return map(np.stack, zip(*UsV_list))
     else:
         raise NotImplementedError()
+
+
+def cholesky(A):
+    """Lower Cholesky factor L of a symmetric positive definite A = L @ L.T"""
+    return np.linalg.cholesky(A)
+
+
+def cho_solve(L, B):
+    """Solve A @ X = B, given the lower Cholesky factor L of A."""
+    if use_scipy:
+        return linalg.cho_solve((L, True), B, check_finite=False)
+    return linalg.solve(L.T, linalg.solve(L, B))
@@ -357,3 +357,15 @@ try:
 except AttributeError:
     # torch.__version__ < 1.8
     eigh = partial(torch.symeig, eigenvectors=True)
+
+
+try:
+    cholesky = torch.linalg.cholesky
+except AttributeError:
+    # torch.__version__ < 1.8
+    cholesky = torch.cholesky
+
+
+def cho_solve(L, B):
+    """Solve A @ X = B, given the lower Cholesky factor L of A."""
+    return torch.cholesky_solve(B, L)
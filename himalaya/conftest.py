@@ -0,0 +1,17 @@
+import pytest
+
+from himalaya.backend import set_backend
+from himalaya.backend import get_backend
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    """Restore the backend after each test.
+
+    Most tests call ``set_backend`` directly, which changes a module-level
+    variable. Restoring it keeps tests independent of the order in which they
+    run, e.g. when sharded across workers with ``pytest -n auto``.
+    """
+    backend_name = get_backend().name
+    yield
+    set_backend(backend_name)
@@ -1,9 +1,15 @@
 """Adapt functions from scikit-learn to use different backends."""
 
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 from functools import partial
 import math
+import os
 
+import numpy as np
+from threadpoolctl import threadpool_limits
+from sklearn import config_context
+from sklearn import get_config
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted
 
@@ -160,6 +166,61 @@ def _normalize(X):
     return X
 
 
+def _inner_products(X, Y):
+    """Compute X @ Y.T, exploiting the symmetry when Y is X.
+
+    With the numpy backend and dense inputs, the symmetric case uses the BLAS
+    routine syrk, which only computes the upper triangle (half the flops of a
+    general matrix product). The lower triangle is then filled by blocks.
+
+    Performs no input validation.
+
+    Parameters
+    ----------
+    X : array of shape (n_samples_X, n_features)
+        Train or test features.
+    Y : array of shape (n_samples_Y, n_features)
+        Train features.
+
+    Returns
+    -------
+    K : array of shape (n_samples_X, n_samples_Y)
+        Inner products between rows of X and rows of Y, as a dense array.
+    """
+    backend = get_backend()
+    if Y is not X or backend.name != "numpy" or issparse(X):
+        K = X @ Y.T
+        if issparse(K):
+            K = K.toarray()
+        return backend.asarray(K)
+
+    try:
+        from scipy.linalg.blas import get_blas_funcs
+    except ImportError:
+        return X @ Y.T
+    syrk = get_blas_funcs("syrk", (X, ))
+
+    # C-contiguous X is seen by BLAS as the Fortran-contiguous X.T, which
+    # avoids a copy of X.
+    if X.flags.c_contiguous:
+        K = syrk(1.0, X.T, trans=1)
+    else:
+        K = syrk(1.0, X, trans=0)
+    _fill_lower_triangle(K)
+    return K
+
+
+def _fill_lower_triangle(K, batch_size=256):
+    """Copy in place the upper triangle of a square matrix into its lower
+    triangle, by blocks to avoid a temporary of the size of K."""
+    n_samples = K.shape[0]
+    for start in range(0, n_samples, batch_size):
+        batch = slice(start, start + batch_size)
+        K[batch, :start] = K[:start, batch].T
+        block = K[batch, batch]
+        block[...] = np.triu(block) + np.triu(block, 1).T
+
+
 ###############################################################################
 
 
@@ -179,13 +240,9 @@ def linear_kernel(X, Y=None):
     K : array of shape (n_samples_X, n_samples_Y)
         Computed kernel.
     """
-    backend = get_backend()
     X, Y = check_pairwise_arrays(X, Y)
 
-    K = X @ Y.T
-    if issparse(K):
-        K = K.toarray()
-    K = backend.asarray(K)
+    K = _inner_products(X, Y)
     return K
 
 
@@ -213,15 +270,21 @@ def polynomial_kernel(X, Y=None, degree=3, gamma=None, coef0=1):
     K : array of shape (n_samples_X, n_samples_Y)
         Computed kernel.
     """
-    backend = get_backend()
     X, Y = check_pairwise_arrays(X, Y)
+
+    K = _inner_products(X, Y)
+    K = _polynomial_from_inner_products(K, X.shape[1], degree=degree,
+                                        gamma=gamma, coef0=coef0)
+    return K
+
+
+def _polynomial_from_inner_products(K, n_features, degree=3, gamma=None,
+                                    coef0=1):
+    """Transform inner products into a polynomial kernel, in place."""
+    backend = get_backend()
     if gamma is None:
-        gamma = 1.0 / X.shape[1]
+        gamma = 1.0 / n_features
 
-    K = X @ Y.T
-    if issparse(K):
-        K = K.toarray()
-    K = backend.asarray(K)
     K *= gamma
     K += coef0
     K = backend.power(K, degree, out=K)
@@ -250,15 +313,19 @@ def sigmoid_kernel(X, Y=None, gamma=None, coef0=1):
     K : array of shape (n_samples_X, n_samples_Y)
         Computed kernel.
     """
-    backend = get_backend()
     X, Y = check_pairwise_arrays(X, Y)
+
+    K = _inner_products(X, Y)
+    K = _sigmoid_from_inner_products(K, X.shape[1], gamma=gamma, coef0=coef0)
+    return K
+
+
+def _sigmoid_from_inner_products(K, n_features, gamma=None, coef0=1):
+    """Transform inner products into a sigmoid kernel, in place."""
+    backend = get_backend()
     if gamma is None:
-        gamma = 1.0 / X.shape[1]
+        gamma = 1.0 / n_features
 
-    K = X @ Y.T
-    if issparse(K):
-        K = K.toarray()
-    K = backend.asarray(K)
     K *= gamma
     K += coef0
     K = backend.tanh(K, out=K)
@@ -289,11 +356,19 @@ def rbf_kernel(X, Y=None, gamma=None):
     """
     backend = get_backend()
     X, Y = check_pairwise_arrays(X, Y)
-    if gamma is None:
-        gamma = 1.0 / X.shape[1]
 
     K = euclidean_distances(X, Y, squared=True)
     K = backend.asarray(K)
+    K = _rbf_from_squared_distances(K, X.shape[1], gamma=gamma)
+    return K
+
+
+def _rbf_from_squared_distances(K, n_features, gamma=None):
+    """Transform squared euclidean distances into a rbf kernel, in place."""
+    backend = get_backend()
+    if gamma is None:
+        gamma = 1.0 / n_features
+
     K *= -gamma
     K = backend.exp(K, out=K)
     return K
@@ -321,7 +396,6 @@ def cosine_similarity_kernel(X, Y=None):
     K : array of shape (n_samples_X, n_samples_Y)
         Computed kernel.
     """
-    backend = get_backend()
     X, Y = check_pairwise_arrays(X, Y)
 
     X_normalized = _normalize(X)
@@ -330,12 +404,7 @@ def cosine_similarity_kernel(X, Y=None):
     else:
         Y_normalized = _normalize(Y)
 
-    K = X_normalized @ Y_normalized.T
-
-    if issparse(K):
-        K = K.toarray()
-    K = backend.asarray(K)
-
+    K = _inner_products(X_normalized, Y_normalized)
     return K
 
 
@@ -464,7 +533,7 @@ def _pairwise_callable(X, Y, metric, force_all_finite=True, **params):
     """
     backend = get_backend()
     X, Y = check_pairwise_arrays(X, Y, force_all_finite=force_all_finite)
-    out = backend.zeros_like(X, shape=(X.shape[0], Y.shape[0]), dtype='float')
+    out = backend.zeros_like(X, shape=(X.shape[0], Y.shape[0]))
 
     if X is Y:
         # Only calculate metric for upper triangle
@@ -561,6 +630,100 @@ def pairwise_kernels(X, Y=None, metric="linear", n_jobs=None, **params):
     return func(X, Y, **params)
 
 
+def _pairwise_kernels_multiple(X, Y, metrics, metrics_params):
+    """Compute multiple kernels between X and Y, sharing computations.
+
+    The inner products X @ Y.T are computed once for all 'linear',
+    'polynomial', 'poly', and 'sigmoid' kernels, and the squared euclidean
+    distances are computed once for all 'rbf' kernels. Other metrics are
+    computed separately with pairwise_kernels.
+
+    Each kernel is written directly in a preallocated array, to avoid
+    stacking a list of kernels (which would double the memory peak). With the
+    numpy backend, the kernels are computed in parallel threads.
+
+    Parameters
+    ----------
+    X : array of shape (n_samples_X, n_features)
+        Train or test features.
+    Y : array of shape (n_samples_Y, n_features) or None
+        Train features.
+    metrics : list of (str or callable)
+        Metrics used to compute each kernel.
+    metrics_params : list of dict
+        Additional parameters for each kernel function.
+
+    Returns
+    -------
+    kernels : array of shape (n_kernels, n_samples_X, n_samples_Y)
+        Computed kernels.
+    """
+    backend = get_backend()
+    X, Y = check_pairwise_arrays(X, Y)
+    n_features = X.shape[1]
+
+    shape = (len(metrics), X.shape[0], Y.shape[0])
+    if issparse(X):
+        kernels = backend.zeros(shape=shape, dtype=_get_string_dtype(X))
+    else:
+        kernels = backend.zeros_like(X, shape=shape)
+
+    # shared computations, using all BLAS threads
+    inner_products, squared_distances = None, None
+    for metric in metrics:
+        if isinstance(metric, str) and metric in ("linear", "polynomial",
+                                                  "poly", "sigmoid"):
+            if inner_products is None:
+                inner_products = _inner_products(X, Y)
+        elif isinstance(metric, str) and metric == "rbf":
+            if squared_distances is None:
+                squared_distances = backend.asarray(
+                    euclidean_distances(X, Y, squared=True))
+
+    def compute_kernel(ii):
+        metric, params = metrics[ii], metrics_params[ii]
+        if isinstance(metric, str) and metric in ("linear", "polynomial",
+                                                  "poly", "sigmoid"):
+            kernels[ii] = inner_products
+            if metric in ("polynomial", "poly"):
+                _polynomial_from_inner_products(kernels[ii], n_features,
+                                                **params)
+            elif metric == "sigmoid":
+                _sigmoid_from_inner_products(kernels[ii], n_features,
+                                             **params)
+
+        elif isinstance(metric, str) and metric == "rbf":
+            kernels[ii] = squared_distances
+            _rbf_from_squared_distances(kernels[ii], n_features, **params)
+
+        else:
+            kernels[ii] = pairwise_kernels(X, Y, metric=metric, **params)
+
+    # The kernels are independent, and numpy releases the GIL in elementwise
+    # operations and BLAS calls, so they are computed in parallel threads on
+    # CPU. BLAS threads are limited to avoid oversubscription.
+    n_cpus = os.cpu_count() or 1
+    n_workers = min(len(metrics), n_cpus)
+    if backend.name == "numpy" and n_workers > 1:
+        with threadpool_limits(limits=max(1, n_cpus // n_workers),
+                               user_api="blas"):
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                # the scikit-learn configuration is thread-local
+                config = get_config()
+
+                def compute_kernel_with_config(ii):
+                    with config_context(**config):
+                        compute_kernel(ii)
+
+                list(executor.map(compute_kernel_with_config,
+                                  range(len(metrics))))
+    else:
+        for ii in range(len(metrics)):
+            compute_kernel(ii)
+
+    return kernels
+
+
 class KernelCenterer(TransformerMixin, BaseEstimator):
     """Center a kernel matrix.
 
@@ -1,9 +1,14 @@
 import os
 import warnings
 import numbers
+import re
+from contextlib import contextmanager
 from functools import partial
 
 import numpy as np
+from joblib import Parallel
+from joblib import delayed
+from joblib import effective_n_jobs
 
 from ..backend import get_backend
 from ..backend._utils import _dtype_to_str
@@ -21,7 +26,7 @@ def solve_multiple_kernel_ridge_random_search(
         Xs=None, local_alpha=True, jitter_alphas=False, random_state=None,
         n_targets_batch=None, n_targets_batch_refit=None, n_alphas_batch=None,
         progress_bar=True, Ks_in_cpu=False, conservative=False, Y_in_cpu=False,
-        diagonalize_method="eigh", return_alphas=False):
+        diagonalize_method="eigh", return_alphas=False, n_jobs=None):
     """Solve multiple kernel ridge regression using random search.
 
     Parameters
@@ -86,6 +91,11 @@ def solve_multiple_kernel_ridge_random_search(
         Method used to diagonalize the kernel.
     return_alphas : bool
         If True, return the best alpha value for each target.
+    n_jobs : int or None
+        Number of threads used to compute the cross-validation scores of
+        different kernel weights combinations in parallel. Each thread holds
+        its own weighted kernel in memory. Results do not depend on n_jobs.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
 
     Returns
     -------
@@ -153,10 +163,21 @@ def solve_multiple_kernel_ridge_random_search(
     cv = check_cv(cv, Y)
     n_splits = cv.get_n_splits()
     n_kernels = len(Ks)
+    # flat view of the kernels, to compute weighted sums with a single GEMV.
+    # Non-contiguous kernels cannot be viewed flat, and reshaping would
+    # silently copy them, so their weighted sums are computed in place.
+    Ks_flat = None
+    if _is_c_contiguous(Ks):
+        Ks_flat = Ks.reshape(n_kernels, -1)
     for train, val in cv.split(Y):
         if len(val) == 0 or len(train) == 0:
             raise ValueError("Empty train or validation set. "
                              "Check that `cv` is correctly defined.")
+    # split indices are computed (and sent to the device) once, and reused for
+    # all hyperparameter candidates
+    splits = [(backend.to_gpu(train, device=device),
+               backend.to_gpu(test, device=device))
+              for train, test in cv.split(Y)]
 
     if jitter_alphas:
         random_generator = check_random_state(random_state)
@@ -198,27 +219,26 @@ def solve_multiple_kernel_ridge_random_search(
         # fill with fake weights, to avoid gettings only zeros.
         refit_weights += (backend.arange(n_targets)[None] + 1) / n_targets
 
-    ###########################################################################
-    # Main loop over hyperparameter candidates (gammas)
-    for ii, gamma in enumerate(
-            bar(gammas, '%d random sampling with cv' % len(gammas),
-                use_it=progress_bar)):
+    # cross-validation scores are computed in parallel over chunks of n_jobs
+    # gammas, then the best hyperparameters are updated in sequence
+    n_jobs_chunk = max(1, effective_n_jobs(n_jobs))
 
+    def weighted_kernel(gamma):
         if Ks_in_cpu:
-            K = (backend.to_cpu(gamma[:, None, None]) * Ks).sum(0)
-            K = backend.to_gpu(K, device=device)
+            gamma = backend.to_cpu(gamma)
+        if Ks_flat is not None:
+            K = (gamma @ Ks_flat).reshape(Ks.shape[1:])
         else:
             K = (gamma[:, None, None] * Ks).sum(0)
+        if Ks_in_cpu:
+            K = backend.to_gpu(K, device=device)
+        return K
 
-        if jitter_alphas:
-            noise = backend.asarray_like(random_generator.rand(), alphas)
-            alphas = given_alphas * (10 ** (noise - 0.5))
-
+    def compute_cv_scores(gamma, alphas):
+        K = weighted_kernel(gamma)
         scores = backend.zeros_like(gammas,
                                     shape=(n_splits, len(alphas), n_targets))
-        for jj, (train, test) in enumerate(cv.split(K)):
-            train = backend.to_gpu(train, device=device)
-            test = backend.to_gpu(test, device=device)
+        for jj, (train, test) in enumerate(splits):
             Ktrain, Ktest = K[train[:, None], train], K[test[:, None], train]
             if fit_intercept:
                 centerer = KernelCenterer()
@@ -246,18 +266,56 @@ def solve_multiple_kernel_ridge_random_search(
                     # n_alphas_batch, n_samples_test, n_targets_batch = \
                     # predictions.shape
 
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings("ignore", category=UserWarning)
-                        scores[jj, alpha_batch, batch] = score_func(
-                            Ytest, predictions)
-                        # n_alphas_batch, n_targets_batch = score.shape
+                    if n_jobs_chunk == 1:
+                        with warnings.catch_warnings():
+                            warnings.filterwarnings("ignore",
+                                                    category=UserWarning)
+                            score = score_func(Ytest, predictions)
+                    else:
+                        # filtered in the main thread, see
+                        # _ignore_score_func_user_warnings
+                        score = score_func(Ytest, predictions)
+                    scores[jj, alpha_batch, batch] = score
+                    # n_alphas_batch, n_targets_batch = score.shape
 
                 # make small alphas impossible to select
                 too_small_alphas = backend.isnan(matrix[:, 0, 0])
                 scores[jj, alpha_batch, :][too_small_alphas] = -1e5
 
                 del matrix, predictions
-            del train, test
+        return scores, K
+
+    def threaded_cv_scores(gamma, alphas):
+        # only keep the scores, to hold a single kernel per thread
+        return compute_cv_scores(gamma, alphas)[0]
+
+    # alphas are jittered in sequence, so that results do not depend on n_jobs
+    alphas_list = [alphas] * len(gammas)
+    if jitter_alphas:
+        for ii in range(len(gammas)):
+            noise = backend.asarray_like(random_generator.rand(), alphas)
+            alphas_list[ii] = given_alphas * (10 ** (noise - 0.5))
+
+    ###########################################################################
+    # Main loop over hyperparameter candidates (gammas)
+    for ii, gamma in enumerate(
+            bar(gammas, '%d random sampling with cv' % len(gammas),
+                use_it=progress_bar)):
+
+        K = None
+        if n_jobs_chunk == 1:
+            scores, K = compute_cv_scores(gamma, alphas_list[ii])
+        else:
+            if ii % n_jobs_chunk == 0:
+                chunk = slice(ii, ii + n_jobs_chunk)
+                with _ignore_score_func_user_warnings(score_func):
+                    chunk_scores = Parallel(n_jobs=n_jobs,
+                                            require="sharedmem")(
+                        delayed(threaded_cv_scores)(gamma_, alphas_)
+                        for gamma_, alphas_ in zip(gammas[chunk],
+                                                   alphas_list[chunk]))
+            scores = chunk_scores[ii % n_jobs_chunk]
+        alphas = alphas_list[ii]
 
         # select best alphas
         alphas_argmax, cv_scores_ii = _select_best_alphas(
@@ -279,6 +337,8 @@ def solve_multiple_kernel_ridge_random_search(
 
         # compute primal or dual weights on the entire dataset (nocv)
         if return_weights is not None:
+            if K is None:
+                K = weighted_kernel(gamma)
             update_indices = backend.flatnonzero(mask)
             if Y_in_cpu:
                 update_indices = backend.to_cpu(update_indices)
@@ -341,7 +401,7 @@ def solve_multiple_kernel_ridge_random_search(
 
                 del dual_weights
             del update_indices
-        del K, mask
+        del K, scores, mask
     # End of main loop
     ###########################################################################
 
@@ -365,6 +425,32 @@ def solve_multiple_kernel_ridge_random_search(
     return results
 
 
+def _is_c_contiguous(array):
+    """Whether a numpy, cupy, or torch array is C-contiguous."""
+    if hasattr(array, "is_contiguous"):
+        return array.is_contiguous()
+    return array.flags.c_contiguous
+
+
+@contextmanager
+def _ignore_score_func_user_warnings(score_func):
+    """Ignore the UserWarnings raised in the module of score_func.
+
+    Warnings filters are global to the process, and ``catch_warnings`` is not
+    thread-safe, so it cannot be used in worker threads. Instead, the filter
+    is set in the main thread, and restricted to the module defining
+    score_func, to avoid ignoring other UserWarnings raised meanwhile.
+    """
+    while isinstance(score_func, partial):
+        score_func = score_func.func
+    module = getattr(score_func, "__module__", None)
+    with warnings.catch_warnings():
+        if module is not None:
+            warnings.filterwarnings("ignore", category=UserWarning,
+                                    module=re.escape(module) + "$")
+        yield
+
+
 def _select_best_alphas(scores, alphas, local_alpha, conservative):
     """Helper to select the best alphas
 
@@ -40,19 +40,16 @@ def _weighted_kernel_ridge_gradient(Ks, Y, dual_weights, exp_deltas, alpha=1.,
     if exp_deltas.ndim == 1:
         exp_deltas = exp_deltas[:, None]
 
-    Ks_times_dualweights = backend.stack(
-        [backend.matmul(K, dual_weights).T for K in Ks], 2)
-
-    predictions = backend.matmul(Ks_times_dualweights,
-                                 exp_deltas.T[..., None])[..., 0].T
+    # one batched matmul over kernels, followed by a weighted sum over kernels
+    predictions = backend.sum(
+        exp_deltas[:, None, :] * backend.matmul(Ks, dual_weights), axis=0)
     residual = predictions - Y
     dampened_residual = residual + dual_weights * alpha
 
     if double_K:
-        Ks_times_dampened_residual = backend.stack(
-            [backend.matmul(K, dampened_residual).T for K in Ks], 2)
-        dual_weight_gradient = backend.matmul(
-            Ks_times_dampened_residual, exp_deltas.T[..., None])[..., 0].T
+        dual_weight_gradient = backend.sum(
+            exp_deltas[:, None, :] * backend.matmul(Ks, dampened_residual),
+            axis=0)
     else:
         dual_weight_gradient = dampened_residual
 
@@ -372,11 +369,9 @@ def solve_weighted_kernel_ridge_conjugate_gradient(Ks, Y, deltas, alpha=1.,
     # Conjugate gradient loop
     converged = backend.zeros_like(Y, dtype=backend.bool, shape=(n_targets))
     for i in range(max_iter):
-        Ks_x_p = backend.matmul(Ks, p)
-        tmp = backend.matmul(backend.transpose(Ks_x_p, (2, 1, 0)),
-                             backend.transpose(exp_deltas,
-                                               (1, 0))[:, :, None])[..., 0]
-        K_x_p_plus_reg = backend.transpose(tmp, (1, 0)) + alpha * p
+        K_x_p = backend.sum(exp_deltas[:, None, :] * backend.matmul(Ks, p),
+                            axis=0)
+        K_x_p_plus_reg = K_x_p + alpha * p
 
         squared_residual_norm = new_squared_residual_norm
         squared_p_A_norm = backend.matmul(
@@ -710,7 +705,8 @@ def solve_kernel_ridge_gradient_descent(K, Y, alpha=1., fit_intercept=False,
 def solve_kernel_ridge_eigenvalues(K, Y, alpha=1., method="eigh",
                                    fit_intercept=False,
                                    negative_eigenvalues="zeros",
-                                   n_targets_batch=None, random_state=None):
+                                   n_targets_batch=None, random_state=None,
+                                   truncation_tol=None):
     """Solve kernel ridge regression using eigenvalues decomposition.
 
     Solve the kernel ridge regression::
@@ -742,6 +738,14 @@ def solve_kernel_ridge_eigenvalues(K, Y, alpha=1., method="eigh",
         Used for memory reasons. If None, uses all n_targets at once.
     random_state : int, or None
         Random generator seed. Not used.
+    truncation_tol : float or None
+        If not None, only the eigenvalues larger than
+        ``truncation_tol * min(alpha)`` are computed, and the other ones are
+        approximated by zero, which is much faster when the spectrum of K
+        decays quickly. The relative error on each discarded component of the
+        solution is then at most truncation_tol. Only used with method="eigh"
+        and the numpy backend (with scipy installed); otherwise, all
+        eigenvalues are computed.
 
     Returns
     -------
@@ -761,6 +765,14 @@ def solve_kernel_ridge_eigenvalues(K, Y, alpha=1., method="eigh",
     if K.shape[0] != K.shape[1]:
         raise ValueError("Kernels must be square.")
 
+    truncated = False
+    if truncation_tol is not None and method == "eigh":
+        try:
+            import scipy.linalg
+            truncated = backend.name == "numpy"
+        except ImportError:
+            pass
+
     centerer, Y_offset = None, None
     if fit_intercept:
         centerer = KernelCenterer()
@@ -768,7 +780,14 @@ def solve_kernel_ridge_eigenvalues(K, Y, alpha=1., method="eigh",
         Y_offset = Y.mean(0)
         Y = Y - Y_offset
 
-    if method == "eigh":
+    if truncated:
+        # diagonalization restricted to the largest eigenvalues
+        threshold = float(truncation_tol * backend.min(alpha))
+        eigenvalues, V = scipy.linalg.eigh(
+            K, subset_by_value=(threshold, backend.inf))
+        U = V
+        Vt = V.T
+    elif method == "eigh":
         # diagonalization: K = V @ np.diag(eigenvalues) @ V.T
         eigenvalues, V = backend.eigh(K)
         # match SVD notations: K = U @ np.diag(eigenvalues) @ Vt
@@ -783,7 +802,7 @@ def solve_kernel_ridge_eigenvalues(K, Y, alpha=1., method="eigh",
     inverse = 1 / (alpha[None] + eigenvalues[:, None])
 
     # negative eigenvalues can emerge from incorrect kernels, or from float32
-    if eigenvalues[0] < 0:
+    if len(eigenvalues) > 0 and eigenvalues[0] < 0:
         if negative_eigenvalues == "nan":
             if alpha < -eigenvalues[0] * 2:
                 return backend.ones_like(Y) * backend.asarray(
@@ -812,16 +831,18 @@ def solve_kernel_ridge_eigenvalues(K, Y, alpha=1., method="eigh",
     for start in range(0, n_targets, n_targets_batch):
         batch = slice(start, start + n_targets_batch)
 
-        iUT = _batch_or_skip(inverse, batch, 1)[:, None, :] * U.T[:, :, None]
-        iUT = backend.transpose(iUT, (2, 0, 1))
-        # iUT.shape = (1 or n_targets_batch, n_samples, n_samples)
-        # Vt.T.shape = (n_samples, n_samples)
-        # Y.T.shape = (n_targets, n_samples)
-        # weights_batch = Vt.T @ iUT @ Y.T (batching over n_targets)
-        if Y.shape[0] < Y.shape[1]:
-            weights_batch = ((Vt.T @ iUT) @ Y.T[batch, :, None])[:, :, 0].T
-        else:
-            weights_batch = Vt.T @ (iUT @ Y.T[batch, :, None])[:, :, 0].T
+        # weights_batch = Vt.T @ diag(inverse) @ U.T @ Y, where inverse is
+        # broadcasted over targets, to avoid a batched matmul
+        UtY = U.T @ Y[:, batch]
+        UtY *= _batch_or_skip(inverse, batch, 1)
+        weights_batch = Vt.T @ UtY
+
+        if truncated:
+            # discarded eigenvalues are approximated by zero, so the
+            # orthogonal complement of U is only scaled by 1 / alpha
+            Y_batch = Y[:, batch]
+            residual = Y_batch - U @ (U.T @ Y_batch)
+            weights_batch += residual / _batch_or_skip(alpha, batch, 0)
 
         dual_weights[:, batch] = backend.to_cpu(weights_batch)
 
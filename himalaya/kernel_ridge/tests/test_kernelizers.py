@@ -17,6 +17,8 @@ from himalaya.kernel_ridge._kernelizer import _end_with_a_kernel
 from himalaya.kernel_ridge import KernelRidge
 from himalaya.kernel_ridge import MultipleKernelRidgeCV
 from himalaya.kernel_ridge import KernelCenterer
+from himalaya.kernel_ridge._kernels import pairwise_kernels
+from himalaya.kernel_ridge._kernels import _pairwise_kernels_multiple
 
 
 @pytest.mark.parametrize('kernel', Kernelizer.ALL_KERNELS)
@@ -34,6 +36,38 @@ def test_kernelizer(backend, kernel):
     assert_array_almost_equal(function(X2, X1), ker.transform(X2))
 
 
+@pytest.mark.parametrize('kernel', Kernelizer.ALL_KERNELS)
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_kernel_symmetric(backend, kernel):
+    # the symmetric case K(X, X) can use a different computation than K(X, Y)
+    backend = set_backend(backend)
+
+    X = backend.asarray(backend.randn(300, 5), backend.float64)
+    function = Kernelizer.ALL_KERNELS[kernel]
+
+    K = function(X)
+    assert_array_almost_equal(K, K.T)
+    assert_array_almost_equal(K, function(X, backend.copy(X)))
+
+
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_pairwise_kernels_multiple(backend):
+    backend = set_backend(backend)
+
+    X1 = backend.asarray(backend.randn(10, 5), backend.float64)
+    X2 = backend.asarray(backend.randn(8, 5), backend.float64)
+    metrics = ["linear", "poly", "rbf", "sigmoid", "cosine", "rbf", "poly"]
+    metrics_params = [{}, {}, {}, {}, {}, dict(gamma=0.5), dict(degree=2)]
+
+    for Y in [None, X1, X2]:
+        kernels = _pairwise_kernels_multiple(X1, Y, metrics, metrics_params)
+        assert kernels.shape == (len(metrics), X1.shape[0],
+                                 X1.shape[0] if Y is None else Y.shape[0])
+        for kernel, metric, params in zip(kernels, metrics, metrics_params):
+            assert_array_almost_equal(
+                kernel, pairwise_kernels(X1, Y, metric=metric, **params))
+
+
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
 def test_kernelizer_callable(backend):
     backend = set_backend(backend)
@@ -339,7 +373,20 @@ class Kernelizer_(Kernelizer):
 @sklearn.utils.estimator_checks.parametrize_with_checks([
     Kernelizer_(),
 ])
+def test_check_estimator(estimator, check):
+    # the full list of checks only runs with one backend
+    set_backend("numpy")
+    check(estimator)
+
+
+@pytest.mark.parametrize('check', [
+    sklearn.utils.estimator_checks.check_fit_score_takes_y,
+    sklearn.utils.estimator_checks.check_estimators_dtypes,
+])
+@pytest.mark.parametrize('Estimator', [
+    Kernelizer_,
+])
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
-def test_check_estimator(estimator, check, backend):
+def test_check_estimator_backends(Estimator, check, backend):
     backend = set_backend(backend)
-    check(estimator)
+    check(Estimator.__name__, Estimator())
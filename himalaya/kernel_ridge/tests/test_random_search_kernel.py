@@ -166,6 +166,44 @@ def test_solve_multiple_kernel_ridge_random_search_single_alpha_numpy(backend):
     )
 
 
+@pytest.mark.parametrize('jitter_alphas', [False, True])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_multiple_kernel_ridge_random_search_n_jobs(
+        backend, jitter_alphas):
+    backend = set_backend(backend)
+    Ks, Y, gammas, Xs = _create_dataset(backend)
+    alphas = backend.asarray_like(backend.logspace(-3, 5, 9), Ks)
+
+    results = []
+    for n_jobs in [1, 2]:
+        results.append(solve_multiple_kernel_ridge_random_search(
+            Ks, Y, n_iter=5, alphas=alphas, return_weights="dual",
+            jitter_alphas=jitter_alphas, random_state=0, progress_bar=False,
+            n_jobs=n_jobs))
+
+    for result_1, result_2 in zip(*results):
+        assert_array_almost_equal(result_1, result_2)
+
+
+@pytest.mark.parametrize('Ks_in_cpu', [False, True])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_multiple_kernel_ridge_random_search_non_contiguous(
+        backend, Ks_in_cpu):
+    backend = set_backend(backend)
+    Ks, Y, gammas, Xs = _create_dataset(backend)
+    alphas = backend.asarray_like(backend.logspace(-3, 5, 9), Ks)
+    Ks, Y = Ks[:, ::2, ::2], Y[::2]  # non-contiguous kernels
+
+    results = []
+    for Ks_ in [Ks, backend.copy(Ks)]:
+        results.append(solve_multiple_kernel_ridge_random_search(
+            Ks_, Y, n_iter=5, alphas=alphas, return_weights="dual",
+            Ks_in_cpu=Ks_in_cpu, random_state=0, progress_bar=False))
+
+    for result_1, result_2 in zip(*results):
+        assert_array_almost_equal(result_1, result_2)
+
+
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
 @pytest.mark.parametrize('n_kernels', [1, 2])
 def test_solve_multiple_kernel_ridge_random_search_global_alpha(
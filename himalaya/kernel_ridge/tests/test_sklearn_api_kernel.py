@@ -2,6 +2,7 @@ import warnings
 
 import pytest
 import sklearn.kernel_ridge
+import sklearn.metrics.pairwise
 import sklearn.utils.estimator_checks
 
 from himalaya.backend import set_backend
@@ -47,21 +48,22 @@ def test_kernel_ridge_vs_scikit_learn(backend, multitarget, kernel):
     else:
         X = Xs[0]
 
-    for alpha in backend.asarray_like(backend.logspace(0, 3, 7), Ks):
+    # copy to CPU once, outside of the loop
+    X_np, Y_np = backend.to_numpy(X), backend.to_numpy(Y)
+    alphas = backend.asarray_like(backend.logspace(0, 3, 7), Ks)
+    for alpha, alpha_np in zip(alphas, backend.to_numpy(alphas)):
         model = KernelRidge(alpha=alpha, kernel=kernel)
         model.fit(X, Y)
 
-        reference = sklearn.kernel_ridge.KernelRidge(
-            alpha=backend.to_numpy(alpha), kernel=kernel)
-        reference.fit(backend.to_numpy(X), backend.to_numpy(Y))
+        reference = sklearn.kernel_ridge.KernelRidge(alpha=alpha_np,
+                                                     kernel=kernel)
+        reference.fit(X_np, Y_np)
 
         assert model.dual_coef_.shape == Y.shape
         assert_array_almost_equal(model.dual_coef_, reference.dual_coef_)
-        assert_array_almost_equal(model.predict(X),
-                                  reference.predict(backend.to_numpy(X)))
+        assert_array_almost_equal(model.predict(X), reference.predict(X_np))
         assert_array_almost_equal(
-            model.score(X, Y).mean(),
-            reference.score(backend.to_numpy(X), backend.to_numpy(Y)))
+            model.score(X, Y).mean(), reference.score(X_np, Y_np))
 
 
 @pytest.mark.parametrize('fit_intercept', [False, True])
@@ -132,19 +134,24 @@ def test_kernel_ridge_vs_scikit_learn_sparse(backend, kernel, format):
         warnings.simplefilter('ignore', scipy.sparse.SparseEfficiencyWarning)
         X = scipy.sparse.rand(*Xs[0].shape, density=0.1, format=format)
 
-    for alpha in backend.asarray_like(backend.logspace(0, 3, 7), Y):
+    # the reference kernel is computed once, and shared over alphas
+    K_reference = sklearn.metrics.pairwise.pairwise_kernels(X, metric=kernel)
+    Y_np = backend.to_numpy(Y)
+    alphas = backend.asarray_like(backend.logspace(0, 3, 7), Y)
+    for alpha, alpha_np in zip(alphas, backend.to_numpy(alphas)):
         model = KernelRidge(alpha=alpha, kernel=kernel)
         model.fit(X, Y)
 
-        reference = sklearn.kernel_ridge.KernelRidge(
-            alpha=backend.to_numpy(alpha), kernel=kernel)
-        reference.fit(X, backend.to_numpy(Y))
+        reference = sklearn.kernel_ridge.KernelRidge(alpha=alpha_np,
+                                                     kernel="precomputed")
+        reference.fit(K_reference, Y_np)
 
         assert model.dual_coef_.shape == Y.shape
         assert_array_almost_equal(model.dual_coef_, reference.dual_coef_)
-        assert_array_almost_equal(model.predict(X), reference.predict(X))
+        assert_array_almost_equal(model.predict(X),
+                                  reference.predict(K_reference))
         assert_array_almost_equal(
-            model.score(X, Y).mean(), reference.score(X, backend.to_numpy(Y)))
+            model.score(X, Y).mean(), reference.score(K_reference, Y_np))
 
 
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
@@ -163,6 +170,20 @@ def test_kernel_ridge_precomputed(backend):
                                   model_2.predict(Ks[0]))
 
 
+@pytest.mark.parametrize('kernel', ['linear', 'rbf', lambda x, y: x @ y.T])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_kernel_ridge_float32(backend, kernel):
+    backend = set_backend(backend)
+    Xs, Ks, Y = _create_dataset(backend)
+    X = backend.asarray(Xs[0], dtype="float32")
+    Y = backend.asarray(Y, dtype="float32")
+
+    model = KernelRidge(kernel=kernel, warn=False)
+    model.fit(X, Y)
+    assert model.dual_coef_.dtype == X.dtype
+    assert model.predict(X).dtype == X.dtype
+
+
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
 def test_kernel_ridge_get_primal_coef(backend):
     backend = set_backend(backend)
@@ -193,6 +214,24 @@ def test_kernel_ridge_get_primal_coef(backend):
         model.get_primal_coef()
 
 
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_kernel_ridge_predict_primal_and_dual(backend):
+    # a linear kernel predicts in the primal or in the dual, depending on the
+    # number of test samples
+    backend = set_backend(backend)
+    Xs, Ks, Y = _create_dataset(backend)
+    X = Xs[0]
+
+    model = KernelRidge(kernel="linear")
+    model.fit(X, Y)
+    assert model._use_primal_prediction(X)
+    assert not model._use_primal_prediction(X[:1])
+
+    reference = backend.to_numpy(Ks[0] @ backend.asarray(model.dual_coef_))
+    assert_array_almost_equal(model.predict(X), reference)
+    assert_array_almost_equal(model.predict(X[:1]), reference[:1])
+
+
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
 def test_weighted_kernel_ridge_get_primal_coef(backend):
     backend = set_backend(backend)
@@ -228,19 +267,21 @@ def test_kernel_ridge_solvers(solver, backend):
     elif solver == "gradient_descent":
         solver_params = dict(max_iter=300, tol=1e-6)
 
-    for alpha in backend.asarray_like(backend.logspace(0, 3, 7), Y):
+    # copy to CPU once, outside of the loop
+    X_np, Y_np = backend.to_numpy(X), backend.to_numpy(Y)
+    alphas = backend.asarray_like(backend.logspace(0, 3, 7), Y)
+    for alpha, alpha_np in zip(alphas, backend.to_numpy(alphas)):
         model = KernelRidge(alpha=alpha, kernel=kernel, solver=solver,
                             solver_params=solver_params)
         model.fit(X, Y)
 
-        reference = sklearn.kernel_ridge.KernelRidge(
-            alpha=backend.to_numpy(alpha), kernel=kernel)
-        reference.fit(backend.to_numpy(X), backend.to_numpy(Y))
+        reference = sklearn.kernel_ridge.KernelRidge(alpha=alpha_np,
+                                                     kernel=kernel)
+        reference.fit(X_np, Y_np)
 
         assert model.dual_coef_.shape == Y.shape
         assert_array_almost_equal(model.dual_coef_, reference.dual_coef_)
-        assert_array_almost_equal(model.predict(X),
-                                  reference.predict(backend.to_numpy(X)),
+        assert_array_almost_equal(model.predict(X), reference.predict(X_np),
                                   decimal=5)
 
 
@@ -664,7 +705,23 @@ class WeightedKernelRidge_(WeightedKernelRidge):
     MultipleKernelRidgeCV_(),
     WeightedKernelRidge_(),
 ])
+def test_check_estimator(estimator, check):
+    # the full list of checks only runs with one backend
+    set_backend("numpy")
+    check(estimator)
+
+
+@pytest.mark.parametrize('check', [
+    sklearn.utils.estimator_checks.check_fit_score_takes_y,
+    sklearn.utils.estimator_checks.check_estimators_dtypes,
+])
+@pytest.mark.parametrize('Estimator', [
+    KernelRidge_,
+    KernelRidgeCV_,
+    MultipleKernelRidgeCV_,
+    WeightedKernelRidge_,
+])
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
-def test_check_estimator(estimator, check, backend):
+def test_check_estimator_backends(Estimator, check, backend):
     backend = set_backend(backend)
-    check(estimator)
+    check(Estimator.__name__, Estimator())
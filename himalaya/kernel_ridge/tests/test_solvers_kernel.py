@@ -54,22 +54,16 @@ def test_weighted_kernel_ridge_gradient(backend, double_K):
     exp_deltas = backend.exp(deltas)
     alpha = 1.
 
-    n_targets = Y.shape[1]
-    grad = backend.zeros_like(dual_weights, dtype=backend.float64)
-    func = backend.zeros_like(dual_weights, dtype=backend.float64,
-                              shape=(n_targets))
-    for tt in range(n_targets):
-        K = backend.sum(
-            backend.stack([K * g for K, g in zip(Ks, exp_deltas[:, tt])]), 0)
-        grad[:, tt] = (backend.matmul(K, dual_weights[:, tt]) - Y[:, tt] +
-                       alpha * dual_weights[:, tt])
-
-        pred = backend.matmul(K, dual_weights[:, tt])
-        func[tt] = backend.sum((pred - Y[:, tt]) ** 2, 0)
-        func[tt] += alpha * (dual_weights[:, tt] @ K @ dual_weights[:, tt])
-
-        if double_K:
-            grad[:, tt] = backend.matmul(K.T, grad[:, tt])
+    # one kernel per target, K_all[tt] = sum_m exp_deltas[m, tt] * Ks[m]
+    K_all = backend.einsum('mij,mt->tij', Ks, exp_deltas)
+    pred = backend.matmul(K_all, dual_weights.T[:, :, None])[..., 0].T
+    grad = pred - Y + alpha * dual_weights
+    func = backend.sum((pred - Y) ** 2, 0)
+    func += alpha * backend.sum(dual_weights * pred, 0)
+
+    if double_K:
+        grad = backend.matmul(backend.transpose(K_all, (0, 2, 1)),
+                              grad.T[:, :, None])[..., 0].T
 
     ########################
     grad2, func2 = _weighted_kernel_ridge_gradient(Ks, Y, dual_weights,
@@ -92,20 +86,24 @@ def test_solve_weighted_kernel_ridge(solver_name, backend):
     Xs, Ks, Y, deltas, dual_weights = _create_dataset(backend, intercept=False)
     exp_deltas = backend.exp(deltas)
 
+    # one kernel per target, K_all[tt] = sum_m exp_deltas[m, tt] * Ks[m]
+    K_all = backend.einsum('mij,mt->tij', Ks, exp_deltas)
+    K_all_numpy = backend.to_numpy(K_all)
+    Y_numpy = backend.to_numpy(Y)
+
     for alpha in backend.asarray_like(backend.logspace(-2, 3, 7), Ks):
         c2 = solver(Ks, Y, deltas, alpha=alpha, max_iter=3000, tol=1e-6)
         c2 = backend.to_gpu(c2)
 
-        n_targets = Y.shape[1]
-        for ii in range(n_targets):
-            # compare dual coefficients with scipy.linalg.solve
-            K = backend.matmul(Ks.T, exp_deltas[:, ii]).T
-            reg = backend.asarray_like(np.eye(K.shape[0]), K) * alpha
-            c1 = scipy.linalg.solve(backend.to_numpy(K + reg),
-                                    backend.to_numpy(Y[:, ii]))
-            assert_array_almost_equal(c1, c2[:, ii], decimal=decimal)
+        # compare dual coefficients with a batched numpy.linalg.solve
+        reg = np.eye(K_all.shape[1])[None] * backend.to_numpy(alpha)
+        c1 = np.linalg.solve(K_all_numpy + reg, Y_numpy.T[:, :, None])
+        assert_array_almost_equal(c1[:, :, 0].T, c2, decimal=decimal)
 
-            if solver_name != "neumann_series":
+        if solver_name != "neumann_series":
+            n_targets = Y.shape[1]
+            for ii in range(n_targets):
+                K = K_all[ii]
                 # compare predictions with sklearn.linear_model.Ridge
                 X_scaled = backend.concatenate([
                     t * backend.sqrt(g) for t, g in zip(Xs, exp_deltas[:, ii])
@@ -114,8 +112,7 @@ def test_solve_weighted_kernel_ridge(solver_name, backend):
                 model = sklearn.linear_model.Ridge(
                     alpha=backend.to_numpy(alpha), solver="lsqr",
                     max_iter=1000, tol=1e-6, fit_intercept=False)
-                model.fit(backend.to_numpy(X_scaled),
-                          backend.to_numpy(Y[:, ii]))
+                model.fit(backend.to_numpy(X_scaled), Y_numpy[:, ii])
                 prediction_sklearn = model.predict(backend.to_numpy(X_scaled))
                 assert_array_almost_equal(prediction, prediction_sklearn,
                                           decimal=decimal)
@@ -247,6 +244,21 @@ def test_solve_kernel_ridge_intercept(solver_name, backend):
                                       decimal=decimal)
 
 
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_kernel_ridge_eigenvalues_truncated(backend):
+    backend = set_backend(backend)
+    # low-rank kernel, with many eigenvalues discarded by the truncation
+    X = backend.asarray(backend.randn(30, 5), backend.float64)
+    K = X @ X.T
+    Y = backend.asarray(backend.randn(30, 3), backend.float64)
+    alpha = backend.asarray_like(backend.logspace(-1, 1, 3), K)
+
+    solver = KERNEL_RIDGE_SOLVERS["eigenvalues"]
+    c1 = solver(K, Y, alpha=alpha)
+    c2 = solver(K, Y, alpha=alpha, truncation_tol=1e-6)
+    assert_array_almost_equal(c1, c2)
+
+
 @pytest.mark.parametrize('solver_name', KERNEL_RIDGE_SOLVERS)
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
 def test_different_number_of_samples(solver_name, backend):
@@ -44,7 +44,20 @@ class SparseGroupLassoCV_(SparseGroupLassoCV):
 @sklearn.utils.estimator_checks.parametrize_with_checks([
     SparseGroupLassoCV_(),
 ])
+def test_check_estimator(estimator, check):
+    # the full list of checks only runs with one backend
+    set_backend("numpy")
+    check(estimator)
+
+
+@pytest.mark.parametrize('check', [
+    sklearn.utils.estimator_checks.check_fit_score_takes_y,
+    sklearn.utils.estimator_checks.check_estimators_dtypes,
+])
+@pytest.mark.parametrize('Estimator', [
+    SparseGroupLassoCV_,
+])
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
-def test_check_estimator(estimator, check, backend):
+def test_check_estimator_backends(Estimator, check, backend):
     backend = set_backend(backend)
-    check(estimator)
+    check(Estimator.__name__, Estimator())
@@ -4,6 +4,8 @@ from ._random_search import solve_group_ridge_random_search
 from ._random_search import solve_ridge_cv_svd
 from ._random_search import GROUP_RIDGE_SOLVERS
 from ._solvers import solve_ridge_svd
+from ._solvers import solve_ridge_cholesky
+from ._solvers import solve_ridge_lsqr
 from ._solvers import RIDGE_SOLVERS
 from ._sklearn_api import Ridge
 from ._sklearn_api import RidgeCV
@@ -23,6 +25,8 @@ __all__ = [
     "GROUP_RIDGE_SOLVERS",
     # ridge solvers
     "solve_ridge_svd",
+    "solve_ridge_cholesky",
+    "solve_ridge_lsqr",
     "solve_ridge_cv_svd",
     "RIDGE_SOLVERS",
     # sklearn API
@@ -9,6 +9,7 @@ from ._random_search import solve_ridge_cv_svd
 
 from ..validation import check_array
 from ..validation import check_cv
+from ..validation import issparse
 from ..validation import _get_string_dtype
 from ..backend import get_backend
 from ..backend import force_cpu_backend
@@ -64,7 +65,10 @@ class Ridge(_BaseRidge):
         If False, X and Y must be zero-mean over samples.
 
     solver : str
-        Algorithm used during the fit, in {"svd"}.
+        Algorithm used during the fit, in {"svd", "cholesky", "lsqr"}.
+        Only "lsqr" accepts sparse X. With "svd", when n_samples < n_features,
+        the decomposition is by default computed on the linear kernel
+        X @ X.T (the "dual" method of ``solve_ridge_svd``) instead of warning.
 
     solver_params : dict or None
         Additional parameters for the solver.
@@ -134,7 +138,8 @@ class Ridge(_BaseRidge):
         self : returns an instance of self.
         """
         # backend = get_backend()
-        X = check_array(X, ndim=2)
+        accept_sparse = ("csr", "csc") if self.solver == "lsqr" else False
+        X = check_array(X, accept_sparse=accept_sparse, ndim=2)
         self.dtype_ = _get_string_dtype(X)
         y = check_array(y, dtype=self.dtype_, ndim=[1, 2])
         if X.shape[0] != y.shape[0]:
@@ -179,12 +184,18 @@ class Ridge(_BaseRidge):
         """
         check_is_fitted(self)
         backend = get_backend()
-        X = check_array(X, dtype=self.dtype_, ndim=2)
+        accept_sparse = ("csr", "csc") if self.solver == "lsqr" else False
+        X = check_array(X, dtype=self.dtype_, accept_sparse=accept_sparse,
+                        ndim=2)
         self.coef_ = check_array(self.coef_, dtype=self.dtype_, ndim=2)
         if X.shape[1] != self.n_features_in_:
             raise ValueError("Different number of features in X than during fit.")
 
-        Y_hat = backend.to_cpu(X) @ backend.to_cpu(self.coef_)
+        if issparse(X):
+            Y_hat = backend.to_cpu(
+                backend.asarray(X @ backend.to_numpy(self.coef_)))
+        else:
+            Y_hat = backend.to_cpu(X) @ backend.to_cpu(self.coef_)
         if self.fit_intercept:
             Y_hat += backend.to_cpu(self.intercept_)
         return Y_hat
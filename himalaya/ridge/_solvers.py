@@ -1,15 +1,24 @@
 import numbers
 import warnings
 
+import numpy as np
+from joblib import Parallel
+from joblib import delayed
+
 from ..backend import get_backend
+from ..backend._utils import _dtype_to_str
 from ..utils import _batch_or_skip
+from ..validation import issparse
 
 
-def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
+def solve_ridge_svd(X, Y, alpha=1., method="auto", fit_intercept=False,
                     negative_eigenvalues="zeros", n_targets_batch=None,
-                    warn=True):
+                    compute_dtype=None, warn=True):
     """Solve ridge regression using SVD decomposition.
 
+    When n_samples < n_features, the SVD is replaced by default with the
+    eigenvalues decomposition of the linear kernel X @ X.T.
+
     Solve the ridge regression::
 
         b* = argmin_B ||X @ b - Y||^2 + alpha ||b||^2
@@ -22,8 +31,14 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
         Target data.
     alpha : float, or array of shape (n_targets, )
         Regularization parameter.
-    method : str in {"svd"}
-        Method used to diagonalize the input feature matrix.
+    method : str in {"auto", "svd", "dual", "eigh"}
+        Method used to diagonalize the input feature matrix. "svd" computes
+        the SVD of X. "dual" computes the eigenvalues decomposition of the
+        linear kernel X @ X.T, which is faster when n_samples < n_features.
+        "auto" uses "svd" if n_samples >= n_features, else "dual".
+        "eigh" computes the eigenvalues decomposition of X, which is faster
+        than the SVD, but requires X to be square and symmetric (e.g. a
+        kernel), and is not compatible with fit_intercept=True.
     fit_intercept : boolean
         Whether to fit an intercept.
         If False, X and Y must be zero-mean over samples.
@@ -32,14 +47,21 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
         from float32 errors):
         - "error" raises an error.
         - "zeros" replaces them with zeros.
-        - "nan" returns nans if the regularization does not compensate
-        twice the smallest negative value, else it ignores the problem.
+        - "nan" returns nans for the targets whose regularization does not
+        compensate twice the smallest negative value, else it ignores the
+        problem.
     n_targets_batch : int or None
         Size of the batch for over targets during cross-validation.
         Used for memory reasons. If None, uses all n_targets at once.
+    compute_dtype : str in {"float32", "float64"}, or None
+        Precision used for the decomposition. For instance, "float32" halves
+        the memory traffic of the SVD of a float64 X, while the projection of
+        Y and the weights are still computed in the precision of X. If None,
+        the decomposition uses the precision of X.
     warn : bool
-        If True, warn if the number of samples is smaller than the number of
-        features.
+        If True, warn if method="svd" is used while the number of samples is
+        smaller than the number of features. With the default method="auto",
+        this regime uses the "dual" method instead, and does not warn.
 
     Returns
     -------
@@ -49,13 +71,23 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
         Intercept. Only returned when fit_intercept is True.
     """
     backend = get_backend()
-    if isinstance(alpha, numbers.Number) or alpha.ndim == 0:
-        alpha = backend.ones_like(Y, shape=(1, )) * alpha
-
-    X, Y, alpha = backend.check_arrays(X, Y, alpha)
+    if negative_eigenvalues not in ("nan", "error", "zeros"):
+        raise ValueError("Unknown negative_eigenvalues=%r." %
+                         (negative_eigenvalues, ))
+    # keep a scalar alpha as a float, to avoid allocating and checking an array
+    if isinstance(alpha, numbers.Number):
+        alpha = float(alpha)
+        X, Y = backend.check_arrays(X, Y)
+    else:
+        # a 0-d array stays on its device, to avoid a device synchronization
+        if alpha.ndim == 0:
+            alpha = backend.ones_like(Y, shape=(1, )) * alpha
+        X, Y, alpha = backend.check_arrays(X, Y, alpha)
 
     n_samples, n_features = X.shape
-    if n_samples < n_features and warn:
+    if method == "auto":
+        method = "svd" if n_samples >= n_features else "dual"
+    if n_samples < n_features and method == "svd" and warn:
         warnings.warn(
             "Solving ridge is slower than solving kernel ridge when n_samples "
             f"< n_features (here {n_samples} < {n_features}). "
@@ -65,6 +97,10 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
     if X.shape[0] != Y.shape[0]:
         raise ValueError("X and Y must have the same number of samples.")
 
+    if method == "eigh" and (n_samples != n_features or fit_intercept):
+        raise ValueError("method='eigh' requires a square symmetric X, and "
+                         "fit_intercept=False.")
+
     X_offset, Y_offset = None, None
     if fit_intercept:
         X_offset = X.mean(0)
@@ -72,34 +108,73 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
         X = X - X_offset
         Y = Y - Y_offset
 
+    X_decomposed = X
+    if compute_dtype is not None:
+        X_decomposed = backend.asarray(X, dtype=compute_dtype, device=None)
+
+    Vt = None
     if method == "svd":
         # SVD: X = U @ np.diag(eigenvalues) @ Vt
-        U, eigenvalues, Vt = backend.svd(X, full_matrices=False)
+        U, eigenvalues, Vt = backend.svd(X_decomposed, full_matrices=False)
+    elif method == "dual":
+        # diagonalization: X @ X.T = U @ np.diag(eigenvalues) @ U.T
+        eigenvalues, U = backend.eigh(X_decomposed @ X_decomposed.T)
+    elif method == "eigh":
+        # diagonalization: X = U @ np.diag(eigenvalues) @ U.T
+        eigenvalues, U = backend.eigh(X_decomposed)
+        Vt = U.T
     else:
         raise ValueError("Unknown method=%r." % (method, ))
+    del X_decomposed
 
-    inverse = eigenvalues[:, None] / (alpha[None] + eigenvalues[:, None] ** 2)
+    if compute_dtype is not None:
+        # back-projections are computed in the precision of X
+        U = backend.asarray_like(U, X)
+        eigenvalues = backend.asarray_like(eigenvalues, X)
+        if Vt is not None:
+            Vt = backend.asarray_like(Vt, X)
 
     # negative eigenvalues can emerge from incorrect kernels, or from float32
-    if eigenvalues[0] < 0:
-        if negative_eigenvalues == "nan":
-            if alpha < -eigenvalues[0] * 2:
-                return backend.ones_like(Y) * backend.asarray(
-                    backend.nan, dtype=Y.dtype)
-            else:
-                pass
+    nan_targets = None
+    if method == "eigh":
+        # eigenvalues of X are signed, and the solution below is exact
+        pass
+    elif negative_eigenvalues == "zeros":
+        # unconditional clipping, to avoid a device synchronization on GPU
+        eigenvalues = backend.clip(eigenvalues, 0, None)
 
-        elif negative_eigenvalues == "zeros":
-            eigenvalues[eigenvalues < 0] = 0
+    else:
+        if method == "dual":
+            # eigenvalues of X @ X.T within roundoff of zero are zeros, e.g.
+            # when X is rank-deficient
+            tol = np.finfo(_dtype_to_str(eigenvalues.dtype)).eps * backend.max(
+                eigenvalues) * n_samples
+            eigenvalues = eigenvalues * (backend.abs(eigenvalues) > tol)
+        min_eigenvalue = backend.min(eigenvalues)
+        if min_eigenvalue < 0:
+            if negative_eigenvalues == "error":
+                raise RuntimeError(
+                    "Negative eigenvalues. Make sure the kernel is positive "
+                    "semi-definite, increase the regularization alpha, or use"
+                    "another solver.")
+            # targets whose alpha does not compensate negative eigenvalues
+            nan_targets = alpha < -min_eigenvalue * 2
+            if isinstance(alpha, float) or alpha.shape[0] == 1:
+                nan_targets = slice(None) if nan_targets else None
+            else:
+                nan_targets = backend.to_cpu(nan_targets)
 
-        elif negative_eigenvalues == "error":
-            raise RuntimeError(
-                "Negative eigenvalues. Make sure the kernel is positive "
-                "semi-definite, increase the regularization alpha, or use"
-                "another solver.")
+    if isinstance(alpha, float):
+        if method in ("svd", "eigh"):
+            inverse = eigenvalues / (alpha + eigenvalues ** 2)
         else:
-            raise ValueError("Unknown negative_eigenvalues=%r." %
-                             (negative_eigenvalues, ))
+            inverse = 1 / (alpha + eigenvalues)
+        inverse = inverse[:, None]
+    elif method in ("svd", "eigh"):
+        inverse = eigenvalues[:, None] / (alpha[None] +
+                                          eigenvalues[:, None] ** 2)
+    else:
+        inverse = 1 / (alpha[None] + eigenvalues[:, None])
 
     n_samples, n_features = X.shape
     n_samples, n_targets = Y.shape
@@ -111,16 +186,116 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
     for start in range(0, n_targets, n_targets_batch):
         batch = slice(start, start + n_targets_batch)
 
-        iUT = _batch_or_skip(inverse, batch, 1)[:, None, :] * U.T[:, :, None]
-        iUT = backend.transpose(iUT, (2, 0, 1))
-        # iUT.shape = (1 or n_targets_batch, n_samples, n_samples)
-
-        if Y.shape[0] < Y.shape[1]:
-            weights_batch = ((Vt.T @ iUT) @ Y.T[batch, :, None])[:, :, 0].T
+        # weights_batch = Vt.T @ diag(inverse) @ U.T @ Y, where inverse is
+        # broadcasted over targets, to avoid a rank-3 temporary
+        UtY = U.T @ Y[:, batch]
+        UtY *= _batch_or_skip(inverse, batch, 1)
+        if method in ("svd", "eigh"):
+            weights_batch = Vt.T @ UtY
         else:
-            weights_batch = Vt.T @ (iUT @ Y.T[batch, :, None])[:, :, 0].T
+            # primal weights from dual weights: X.T @ (U @ UtY)
+            weights_batch = X.T @ (U @ UtY)
         weights[:, batch] = backend.to_cpu(weights_batch)
 
+    if nan_targets is not None:
+        weights[:, nan_targets] = backend.nan
+
+    if fit_intercept:
+        intercept = backend.to_cpu(
+            Y_offset) - backend.to_cpu(X_offset) @ weights
+        return weights, intercept
+    else:
+        return weights
+
+
+def solve_ridge_cholesky(X, Y, alpha=1., fit_intercept=False,
+                         n_targets_batch=None, warn=True):
+    """Solve ridge regression using a Cholesky decomposition.
+
+    Solve the ridge regression::
+
+        b* = argmin_B ||X @ b - Y||^2 + alpha ||b||^2
+
+    by factorizing the normal equations (X.T @ X + alpha I) @ b = X.T @ Y.
+    This is faster than the SVD solver when n_samples >= n_features, but one
+    decomposition is needed for each distinct value of alpha.
+
+    Parameters
+    ----------
+    X : array of shape (n_samples, n_features)
+        Input features.
+    Y : array of shape (n_samples, n_targets)
+        Target data.
+    alpha : float, or array of shape (n_targets, )
+        Regularization parameter. Should be strictly positive.
+    fit_intercept : boolean
+        Whether to fit an intercept.
+        If False, X and Y must be zero-mean over samples.
+    n_targets_batch : int or None
+        Size of the batch for over targets during the triangular solves.
+        Used for memory reasons. If None, uses all n_targets at once.
+    warn : bool
+        If True, warn if the number of samples is smaller than the number of
+        features.
+
+    Returns
+    -------
+    weights : array of shape (n_features, n_targets)
+        Ridge coefficients.
+    intercept : array of shape (n_targets,)
+        Intercept. Only returned when fit_intercept is True.
+    """
+    backend = get_backend()
+    if isinstance(alpha, numbers.Number) or alpha.ndim == 0:
+        alpha = backend.ones_like(Y, shape=(1, )) * alpha
+
+    X, Y, alpha = backend.check_arrays(X, Y, alpha)
+    n_targets = Y.shape[1]
+    if n_targets_batch is None:
+        n_targets_batch = n_targets
+
+    n_samples, n_features = X.shape
+    if n_samples < n_features and warn:
+        warnings.warn(
+            "Solving ridge is slower than solving kernel ridge when n_samples "
+            f"< n_features (here {n_samples} < {n_features}). "
+            "Using a linear kernel in himalaya.kernel_ridge.KernelRidge or "
+            "himalaya.kernel_ridge.solve_kernel_ridge_eigenvalues would be "
+            "faster. Use warn=False to silence this warning.", UserWarning)
+    if X.shape[0] != Y.shape[0]:
+        raise ValueError("X and Y must have the same number of samples.")
+
+    X_offset, Y_offset = None, None
+    if fit_intercept:
+        X_offset = X.mean(0)
+        Y_offset = Y.mean(0)
+        X = X - X_offset
+        Y = Y - Y_offset
+
+    XTX = X.T @ X
+    XTY = X.T @ Y
+
+    def solve(alpha_value, XTY):
+        XTX_reg = backend.copy(XTX)
+        diagonal_view = backend.diagonal_view(XTX_reg)
+        diagonal_view += alpha_value
+        L = backend.cholesky(XTX_reg)
+        weights = backend.zeros_like(XTY)
+        for start in range(0, XTY.shape[1], n_targets_batch):
+            batch = slice(start, start + n_targets_batch)
+            weights[:, batch] = backend.cho_solve(L, XTY[:, batch])
+        return weights
+
+    if alpha.shape[0] == 1:
+        weights = solve(alpha[0], XTY)
+    else:
+        # one decomposition per distinct alpha, shared by all its targets
+        weights = backend.zeros_like(XTY)
+        for alpha_value in backend.unique(alpha):
+            targets = backend.flatnonzero(alpha == alpha_value)
+            weights[:, targets] = solve(alpha_value, XTY[:, targets])
+    weights = backend.to_cpu(weights)
+
     if fit_intercept:
         intercept = backend.to_cpu(
             Y_offset) - backend.to_cpu(X_offset) @ weights
@@ -129,5 +304,98 @@ def solve_ridge_svd(X, Y, alpha=1., method="svd", fit_intercept=False,
         return weights
 
 
+def solve_ridge_lsqr(X, Y, alpha=1., fit_intercept=False, tol=1e-8,
+                     max_iter=None, n_targets_batch=None, n_jobs=None):
+    """Solve ridge regression using LSMR, an iterative least-squares solver.
+
+    Solve the ridge regression::
+
+        b* = argmin_B ||X @ b - Y||^2 + alpha ||b||^2
+
+    X is only used through matrix-vector products, so a sparse X is never
+    densified, even when fitting an intercept. Computations are performed on
+    CPU with ``scipy.sparse.linalg.lsmr``, one target at a time.
+
+    Parameters
+    ----------
+    X : array or sparse matrix of shape (n_samples, n_features)
+        Input features.
+    Y : array of shape (n_samples, n_targets)
+        Target data.
+    alpha : float, or array of shape (n_targets, )
+        Regularization parameter.
+    fit_intercept : boolean
+        Whether to fit an intercept.
+        If False, X and Y must be zero-mean over samples.
+    tol : float
+        Tolerance of LSMR stopping criteria (atol and btol).
+    max_iter : int or None
+        Maximum number of LSMR iterations. If None, uses min(n_samples,
+        n_features).
+    n_targets_batch : int or None
+        Number of targets dispatched together to each thread. If None, the
+        batch size is chosen by joblib.
+    n_jobs : int or None
+        Number of threads used to solve different targets in parallel.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+
+    Returns
+    -------
+    weights : array of shape (n_features, n_targets)
+        Ridge coefficients.
+    intercept : array of shape (n_targets,)
+        Intercept. Only returned when fit_intercept is True.
+    """
+    try:
+        from scipy.sparse.linalg import LinearOperator, lsmr
+    except ImportError as error:
+        raise ImportError("solve_ridge_lsqr requires scipy.") from error
+    backend = get_backend()
+
+    if not issparse(X):
+        X = backend.to_numpy(X)
+    Y = backend.to_numpy(Y)
+    dtype = X.dtype
+    if X.shape[0] != Y.shape[0]:
+        raise ValueError("X and Y must have the same number of samples.")
+    n_samples, n_features = X.shape
+    n_targets = Y.shape[1]
+    alpha = np.broadcast_to(backend.to_numpy(alpha), (n_targets, ))
+
+    X_offset, Y_offset = None, None
+    operator = X
+    if fit_intercept:
+        # center X implicitly, to keep it sparse
+        X_offset = np.asarray(X.mean(0)).ravel()
+        Y_offset = Y.mean(0)
+        Y = Y - Y_offset
+        operator = LinearOperator(
+            shape=X.shape, dtype=dtype,
+            matvec=lambda v: X @ v - X_offset @ v,
+            rmatvec=lambda u: X.T @ u - X_offset * u.sum())
+
+    def solve(tt):
+        return lsmr(operator, Y[:, tt], damp=np.sqrt(alpha[tt]), atol=tol,
+                    btol=tol, maxiter=max_iter)[0]
+
+    batch_size = "auto" if n_targets_batch is None else n_targets_batch
+    weights = Parallel(n_jobs=n_jobs, require="sharedmem",
+                       batch_size=batch_size)(
+        delayed(solve)(tt) for tt in range(n_targets))
+    weights = np.stack(weights, axis=1).astype(dtype, copy=False)
+    weights = backend.to_cpu(backend.asarray(weights))
+
+    if fit_intercept:
+        intercept = Y_offset - X_offset @ backend.to_numpy(weights)
+        intercept = backend.to_cpu(backend.asarray(intercept, dtype=dtype))
+        return weights, intercept
+    else:
+        return weights
+
+
 #: Dictionary with all ridge solvers
-RIDGE_SOLVERS = {"svd": solve_ridge_svd}
+RIDGE_SOLVERS = {
+    "svd": solve_ridge_svd,
+    "cholesky": solve_ridge_cholesky,
+    "lsqr": solve_ridge_lsqr,
+}
@@ -1,3 +1,4 @@
+import numpy as np
 from himalaya.scoring import r2_score
 import pytest
 import sklearn.kernel_ridge
@@ -61,6 +62,31 @@ def test_ridge_vs_scikit_learn(backend, multitarget, fit_intercept):
             reference.score(backend.to_numpy(X), backend.to_numpy(Y)))
 
 
+@pytest.mark.parametrize('fit_intercept', [True, False])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_ridge_lsqr_sparse(backend, fit_intercept):
+    scipy_sparse = pytest.importorskip("scipy.sparse")
+    backend = set_backend(backend)
+    X, Y = _create_dataset(backend)
+    X = backend.to_numpy(X)
+    X[np.abs(X) < 1] = 0
+    X_sparse = scipy_sparse.csr_matrix(X)
+    X = backend.asarray(X)
+    Y += 10
+
+    model = Ridge(alpha=1., fit_intercept=fit_intercept, solver="lsqr")
+    model.fit(X_sparse, Y)
+    reference = Ridge(alpha=1., fit_intercept=fit_intercept, solver="svd")
+    reference.fit(X, Y)
+
+    assert_array_almost_equal(model.coef_, reference.coef_, decimal=5)
+    # predictions are on CPU, as with a dense X
+    Y_pred = model.predict(X_sparse)
+    Y_pred_reference = reference.predict(X)
+    assert type(Y_pred) is type(Y_pred_reference)
+    assert_array_almost_equal(Y_pred, Y_pred_reference, decimal=5)
+
+
 @pytest.mark.parametrize('fit_intercept', [True, False])
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
 def test_ridge_cv_vs_scikit_learn(backend, fit_intercept):
@@ -226,7 +252,22 @@ class GroupRidgeCV_(GroupRidgeCV):
     RidgeCV_(),
     GroupRidgeCV_(),
 ])
+def test_check_estimator(estimator, check):
+    # the full list of checks only runs with one backend
+    set_backend("numpy")
+    check(estimator)
+
+
+@pytest.mark.parametrize('check', [
+    sklearn.utils.estimator_checks.check_fit_score_takes_y,
+    sklearn.utils.estimator_checks.check_estimators_dtypes,
+])
+@pytest.mark.parametrize('Estimator', [
+    Ridge_,
+    RidgeCV_,
+    GroupRidgeCV_,
+])
 @pytest.mark.parametrize('backend', ALL_BACKENDS)
-def test_check_estimator(estimator, check, backend):
+def test_check_estimator_backends(Estimator, check, backend):
     backend = set_backend(backend)
-    check(estimator)
+    check(Estimator.__name__, Estimator())
@@ -108,9 +108,137 @@ def test_warning_kernel_ridge_ridge(solver_name, backend):
     X, Y, weights = _create_dataset(backend)
     solver = RIDGE_SOLVERS[solver_name]
 
+    if solver_name == "lsqr":
+        pytest.skip("The iterative solver does not depend on n_samples.")
+    kwargs = dict(method="svd") if solver_name == "svd" else {}
     with pytest.warns(UserWarning,
                       match="ridge is slower than solving kernel"):
-        solver(X[:4], Y[:4])
+        solver(X[:4], Y[:4], **kwargs)
+
+
+@pytest.mark.parametrize('fit_intercept', [False, True])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_dual(backend, fit_intercept):
+    backend = set_backend(backend)
+    X, Y, weights = _create_dataset(backend)
+    X, Y = X[:6], Y[:6]  # n_samples < n_features
+    alpha = backend.asarray_like(backend.logspace(-1, 1, 3), Y)
+
+    solver = RIDGE_SOLVERS["svd"]
+    results_svd = solver(X, Y, alpha=alpha, method="svd", warn=False,
+                         fit_intercept=fit_intercept)
+    results_dual = solver(X, Y, alpha=alpha, method="dual",
+                          fit_intercept=fit_intercept)
+    if not fit_intercept:
+        results_svd, results_dual = [results_svd], [results_dual]
+    for result_svd, result_dual in zip(results_svd, results_dual):
+        assert_array_almost_equal(result_svd, result_dual)
+
+
+@pytest.mark.parametrize('negative_eigenvalues', ["error", "nan"])
+@pytest.mark.parametrize('method', ["auto", "dual"])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_dual_rank_deficient(backend, method,
+                                             negative_eigenvalues):
+    # roundoff negative eigenvalues of X @ X.T are treated as zeros
+    backend = set_backend(backend)
+    X = np.repeat(np.random.randn(3, 10), 2, axis=0)  # rank 3
+    Y = np.random.randn(6, 3)
+    X = backend.asarray(X, backend.float64)
+    Y = backend.asarray(Y, backend.float64)
+    alpha = backend.asarray_like(backend.logspace(-1, 1, 3), Y)
+
+    solver = RIDGE_SOLVERS["svd"]
+    result_svd = solver(X, Y, alpha=alpha, method="svd", warn=False)
+    result_dual = solver(X, Y, alpha=alpha, method=method,
+                         negative_eigenvalues=negative_eigenvalues)
+    assert_array_almost_equal(result_svd, result_dual)
+
+
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_negative_eigenvalues_nan(backend, monkeypatch):
+    backend = set_backend(backend)
+    X, Y, weights = _create_dataset(backend)
+    X, Y = X[:6], Y[:6]  # n_samples < n_features
+
+    eigh = backend.eigh
+
+    def eigh_with_negative_eigenvalue(K):
+        eigenvalues, U = eigh(K)
+        eigenvalues = backend.to_numpy(eigenvalues).copy()
+        eigenvalues[0] = -1
+        return backend.asarray_like(eigenvalues, U), U
+
+    monkeypatch.setattr(backend, "eigh", eigh_with_negative_eigenvalue)
+
+    # only the targets with alpha < 2 are set to nan
+    solver = RIDGE_SOLVERS["svd"]
+    alpha = backend.asarray_like(np.array([0.1, 10., 1.]), Y)
+    result = backend.to_numpy(
+        solver(X, Y, alpha=alpha, method="dual", negative_eigenvalues="nan"))
+    assert np.all(np.isnan(result[:, [0, 2]]))
+    reference = solver(X, Y, alpha=10., method="dual",
+                       negative_eigenvalues="nan")
+    assert_array_almost_equal(result[:, 1], reference[:, 1])
+
+    result = solver(X, Y, alpha=0.1, method="dual", negative_eigenvalues="nan")
+    assert np.all(np.isnan(backend.to_numpy(result)))
+
+
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_eigh(backend):
+    backend = set_backend(backend)
+    X, Y, weights = _create_dataset(backend)
+    K = X @ X.T  # square and symmetric
+    alpha = backend.asarray_like(backend.logspace(-1, 1, 3), Y)
+
+    solver = RIDGE_SOLVERS["svd"]
+    result_svd = solver(K, Y, alpha=alpha, method="svd")
+    result_eigh = solver(K, Y, alpha=alpha, method="eigh")
+    assert_array_almost_equal(result_svd, result_eigh)
+
+    with pytest.raises(ValueError, match="square symmetric"):
+        solver(X, Y, method="eigh")
+
+
+@pytest.mark.parametrize('method', ["auto", "svd", "dual", "eigh"])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_unknown_negative_eigenvalues(backend, method):
+    backend = set_backend(backend)
+    X, Y, weights = _create_dataset(backend)
+    K = X @ X.T  # square and symmetric
+
+    solver = RIDGE_SOLVERS["svd"]
+    with pytest.raises(ValueError, match="Unknown negative_eigenvalues"):
+        solver(K, Y, method=method, negative_eigenvalues="wrong")
+
+
+@pytest.mark.parametrize('method', ["svd", "dual"])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_compute_dtype(backend, method):
+    backend = set_backend(backend)
+    X, Y, weights = _create_dataset(backend)
+    alpha = backend.asarray_like(backend.logspace(-1, 1, Y.shape[1]), Y)
+
+    solver = RIDGE_SOLVERS["svd"]
+    reference = solver(X, Y, alpha=alpha, method=method, warn=False)
+    result = solver(X, Y, alpha=alpha, method=method, warn=False,
+                    compute_dtype="float32")
+    assert result.dtype == reference.dtype
+    assert_array_almost_equal(result, reference, decimal=3)
+
+
+@pytest.mark.parametrize('method', ["svd", "dual"])
+@pytest.mark.parametrize('backend', ALL_BACKENDS)
+def test_solve_ridge_svd_scalar_array_alpha(backend, method):
+    backend = set_backend(backend)
+    X, Y, weights = _create_dataset(backend)
+
+    solver = RIDGE_SOLVERS["svd"]
+    reference = solver(X, Y, alpha=3., method=method, warn=False)
+    alpha = backend.asarray_like(np.array(3.), Y)  # 0-d array
+    result = solver(X, Y, alpha=alpha, method=method, warn=False)
+    assert_array_almost_equal(result, reference)
 
 
 @pytest.mark.parametrize('solver_name', RIDGE_SOLVERS)